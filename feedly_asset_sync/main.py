@@ -1,11 +1,29 @@
+import asyncio
+import itertools
 import json
 import logging
 import logging.handlers
-import time
-import urllib.parse
-from typing import Dict, List, Set, Any
+import queue
+from typing import Dict, List, Set, Any, Tuple
 
-import requests
+import aiohttp
+import orjson
+from aiohttp_retry import ExponentialRetry, RetryClient
+from aiolimiter import AsyncLimiter
+
+#: Maximum Feedly API write requests per second.
+FEEDLY_REQUESTS_PER_SECOND = 4
+
+#: Template for the entity dicts sent to Feedly; copied per entry so the
+#: shared type key and value are reused instead of rebuilt per literal.
+_KEYWORD_TEMPLATE = {"type": "customKeyword", "text": ""}
+
+
+def _keyword_entity(text: str) -> Dict[str, str]:
+    """Build a Feedly customKeyword entity dict for the given text."""
+    entity = _KEYWORD_TEMPLATE.copy()
+    entity["text"] = text
+    return entity
 
 
 def load_config(config_path: str) -> Dict[str, Any]:
@@ -26,29 +44,43 @@ def load_config(config_path: str) -> Dict[str, Any]:
         raise ValueError(f"Invalid JSON in config file: {config_path}") from e
 
 
-def setup_logger(log_filename: str) -> logging.Logger:
+def setup_logger(
+    log_filename: str,
+) -> Tuple[logging.Logger, logging.handlers.QueueListener]:
     """Set up and configure logger.
 
+    Log calls only enqueue records; a background listener owns the
+    rotating file handler, so the sync loops never block on disk I/O.
+
     Args:
         log_filename: Name of the log file
 
     Returns:
-        Configured logger instance
+        Configured logger instance and the started queue listener,
+        which must be stopped at shutdown to flush pending records
     """
     logger = logging.getLogger("FeedlyAssetIntegrator")
     logger.setLevel(logging.DEBUG)
 
-    handler = logging.handlers.RotatingFileHandler(
+    file_handler = logging.handlers.RotatingFileHandler(
         log_filename, maxBytes=5 * 1024 * 1024, backupCount=5
     )
     formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    file_handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
-    return logger
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    listener.start()
 
+    return logger, listener
 
-def fetch_jira_data(
+
+async def fetch_jira_data(
+    session: RetryClient,
     jira_url: str,
     aql_query: str,
     page_size: int,
@@ -57,7 +89,12 @@ def fetch_jira_data(
 ) -> List[Dict[str, Any]]:
     """Fetch data from Jira API using AQL query.
 
+    Fetches the first page to learn how many pages exist, then fetches
+    all remaining pages concurrently with a bounded number of requests
+    in flight.
+
     Args:
+        session: Shared HTTP session
         jira_url: Base URL for Jira API
         aql_query: AQL query string
         page_size: Number of results per page
@@ -67,32 +104,50 @@ def fetch_jira_data(
     Returns:
         List of object entries from Jira
     """
-    all_entries = []
-    current_page = 1
-    encoded_aql_query = urllib.parse.quote(aql_query)
-
-    while True:
-        url = f"{jira_url}/rest/assets/latest/aql/objects?resultPerPage={page_size}&page={current_page}&qlQuery={encoded_aql_query}"
-        logger.debug("Fetching data from Jira API: %s", url)
-
-        try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error("Error fetching data: %s", str(e))
-            break
-
-        data = response.json()
-        object_entries = data.get("objectEntries", [])
-        all_entries.extend(object_entries)
+    all_entries: List[Dict[str, Any]] = []
+    base_url = f"{jira_url}/rest/assets/latest/aql/objects"
+    base_params = {"resultPerPage": page_size, "qlQuery": aql_query}
+    semaphore = asyncio.Semaphore(10)
+
+    async def _fetch_page(page: int) -> Dict[str, Any]:
+        logger.debug("Fetching page %d from Jira API: %s", page, base_url)
+
+        async with semaphore:
+            async with session.get(
+                base_url,
+                params={**base_params, "page": page},
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+
+    async def _fetch_page_entries(page: int) -> List[Dict[str, Any]]:
+        # Keep only the entries so the surrounding page dict (and the
+        # response bytes) are released as soon as each page is parsed,
+        # rather than held alive for the duration of the whole gather.
+        data = await _fetch_page(page)
+        return data.get("objectEntries", [])
 
-        page_number = data.get("pageNumber", 1)
-        total_pages = data.get("pageSize", 1)
-
-        if page_number >= total_pages:
-            break
-
-        current_page += 1
+    try:
+        first_page = await _fetch_page(1)
+        all_entries = first_page.get("objectEntries", [])
+
+        # "pageSize" is the per-page size, not the page count; derive
+        # the number of pages from the total match count instead.
+        total = first_page.get("total", 0)
+        total_pages = -(-total // page_size) if total else 1
+        del first_page
+
+        if total_pages > 1:
+            pages = await asyncio.gather(
+                *[_fetch_page_entries(page) for page in range(2, total_pages + 1)]
+            )
+            # One concatenation pass over all pages instead of growing
+            # all_entries page by page through repeated extends.
+            all_entries = list(itertools.chain.from_iterable([all_entries, *pages]))
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error("Error fetching data: %s", str(e))
 
     logger.info("Total entries fetched: %d", len(all_entries))
     return all_entries
@@ -100,17 +155,21 @@ def fetch_jira_data(
 
 def process_entries(
     entries: List[Dict[str, Any]], logger: logging.Logger
-) -> Dict[str, List[str]]:
+) -> Dict[str, Dict[str, None]]:
     """Process Jira entries into object type lists.
 
+    Labels are collected as keys of an insertion-ordered dict, so
+    duplicates are dropped at insertion time while the first-seen order
+    is preserved.
+
     Args:
         entries: List of entries from Jira
         logger: Logger instance
 
     Returns:
-        Dictionary mapping object types to lists of labels
+        Dictionary mapping object types to their unique labels
     """
-    object_type_lists = {}
+    object_type_lists: Dict[str, Dict[str, None]] = {}
 
     if not entries:
         logger.warning("No entries found to process.")
@@ -119,7 +178,8 @@ def process_entries(
     logger.debug("Starting to process %d entries.", len(entries))
 
     for entry in entries:
-        object_type_name = entry.get("objectType", {}).get("name")
+        object_type = entry.get("objectType")
+        object_type_name = object_type.get("name") if object_type else None
         if not object_type_name:
             logger.warning("Entry does not have an objectType name.")
             continue
@@ -127,20 +187,29 @@ def process_entries(
         label_value = entry.get("label")
 
         if label_value:
-            object_type_lists.setdefault(object_type_name, []).append(label_value)
+            object_type_lists.setdefault(object_type_name, {})[label_value] = None
         else:
             logger.warning("No 'label' attribute found for entry: %s", entry)
 
-    logger.debug("Processed entries into object type lists: %s", object_type_lists)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Processed entries into object type lists: %s", object_type_lists)
     return object_type_lists
 
 
-def fetch_feedly_data(
-    upload_url: str, headers: Dict[str, str], logger: logging.Logger
+async def fetch_feedly_data(
+    session: RetryClient,
+    upload_url: str,
+    headers: Dict[str, str],
+    logger: logging.Logger,
 ) -> List[Dict[str, Any]]:
     """Fetch data from Feedly API.
 
+    Each returned item carries its entities flattened into a
+    ``_entity_texts`` set; the per-entity dicts are dropped from
+    working memory and only rebuilt when a payload is sent to Feedly.
+
     Args:
+        session: Shared HTTP session
         upload_url: URL for Feedly API
         headers: HTTP headers for the request
         logger: Logger instance
@@ -149,19 +218,33 @@ def fetch_feedly_data(
         List of items from Feedly
     """
     try:
-        response = requests.get(
-            f"{upload_url}?details=true", headers=headers, timeout=30
-        )
-        response.raise_for_status()
-        logger.debug("Successfully retrieved data from feedly")
-        return response.json()
-    except requests.RequestException as e:
+        async with session.get(
+            f"{upload_url}?details=true",
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as response:
+            response.raise_for_status()
+            logger.debug("Successfully retrieved data from feedly")
+            items = orjson.loads(await response.read())
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         logger.error("Error fetching data from Feedly: %s", str(e))
         return []
 
+    # Filter out entities without a text once here, so downstream code
+    # can index entity["text"] directly and no None ever enters the sets.
+    # Keeping only the texts (a tuple-sized set entry instead of a dict
+    # per entity) cuts the in-flight memory per entity severalfold.
+    for item in items:
+        item["_entity_texts"] = set(
+            filter(None, (entity.get("text") for entity in item.pop("entities", ())))
+        )
+
+    return items
 
-def sync_to_feedly(
-    jira_data: Dict[str, List[str]],
+
+async def sync_to_feedly(
+    session: RetryClient,
+    jira_data: Dict[str, Dict[str, None]],
     feedly_data: List[Dict[str, Any]],
     upload_url: str,
     headers: Dict[str, str],
@@ -170,54 +253,69 @@ def sync_to_feedly(
 ) -> None:
     """Synchronize Jira data to Feedly.
 
+    Updates for different object types are dispatched concurrently over
+    the shared session; a rate limiter keeps the combined request rate
+    below the Feedly API limit.
+
     Args:
-        jira_data: Dictionary mapping object types to lists of labels
-        feedly_data: List of items from Feedly
+        session: Shared HTTP session
+        jira_data: Dictionary mapping object types to their unique labels
+        feedly_data: List of items from fetch_feedly_data
         upload_url: URL for Feedly API
         headers: HTTP headers for the request
         logger: Logger instance
         test_mode: Whether to run in test mode (no actual API calls)
     """
     try:
-        feedly_entities = {
-            item["label"]: {entity.get("text") for entity in item.get("entities", [])}
-            for item in feedly_data
-        }
-        logger.debug("Feedly entities structure: %s", feedly_entities)
+        # Bucket the Feedly lists by object type once ("Server-2" -> "Server")
+        # instead of rescanning all labels for every object type. The
+        # _entity_texts sets were cached at ingestion by fetch_feedly_data.
+        buckets: Dict[str, List[Dict[str, Any]]] = {}
+        for item in feedly_data:
+            key = item["label"].rsplit("-", 1)[0]
+            buckets.setdefault(key, []).append(item)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            feedly_entities = {
+                item["label"]: item["_entity_texts"] for item in feedly_data
+            }
+            logger.debug("Feedly entities structure: %s", feedly_entities)
 
         list_counts = {
-            object_type: len(
-                [label for label in feedly_entities if label.startswith(object_type)]
-            )
+            object_type: len(buckets.get(object_type, []))
             for object_type in jira_data
         }
 
+        limiter = AsyncLimiter(FEEDLY_REQUESTS_PER_SECOND, 1)
+        tasks = []
+
         for object_type, names in jira_data.items():
             logger.debug(
                 "Processing object type: %s with names: %s", object_type, names
             )
 
-            existing_lists = [
-                item for item in feedly_data if item["label"].startswith(object_type)
-            ]
-            new_entries = set(names)
-
-            for item in existing_lists:
-                current_entities = {
-                    entity.get("text") for entity in item.get("entities", [])
-                }
-                new_entries -= current_entities
-
-            _add_entries_to_feedly(
-                new_entries,
-                existing_lists,
-                object_type,
-                list_counts,
-                upload_url,
-                headers,
-                logger,
-                test_mode,
+            existing_lists = buckets.get(object_type, [])
+            already = set().union(
+                *(item["_entity_texts"] for item in existing_lists)
             )
+            new_entries = set(names).difference(already)
+
+            tasks.extend(
+                _add_entries_to_feedly(
+                    new_entries,
+                    existing_lists,
+                    object_type,
+                    list_counts,
+                    session,
+                    limiter,
+                    upload_url,
+                    headers,
+                    logger,
+                    test_mode,
+                )
+            )
+
+        await asyncio.gather(*tasks)
 
     except (KeyError, TypeError) as e:
         logger.error("Data structure error in sync_to_feedly: %s", str(e))
@@ -230,74 +328,110 @@ def _add_entries_to_feedly(
     existing_lists: List[Dict[str, Any]],
     object_type: str,
     list_counts: Dict[str, int],
+    session: RetryClient,
+    limiter: AsyncLimiter,
     upload_url: str,
     headers: Dict[str, str],
     logger: logging.Logger,
     test_mode: bool,
-) -> None:
-    """Add new entries to Feedly lists.
+) -> List[Any]:
+    """Plan the requests that add new entries to Feedly lists.
+
+    Fills each existing list up to the 50-entity cap in a single pass,
+    then assigns the leftovers to new lists in chunks of 50. All local
+    state is mutated upfront, so each affected list gets exactly one
+    PUT and each new list exactly one POST; the returned coroutines are
+    dispatched together by the caller.
 
     Args:
         new_entries: Set of new entries to add
         existing_lists: List of existing Feedly lists
         object_type: Type of object being processed
         list_counts: Counts of existing lists by object type
+        session: Shared HTTP session for Feedly requests
+        limiter: Rate limiter shared by all Feedly requests
         upload_url: URL for Feedly API
         headers: HTTP headers for the request
         logger: Logger instance
         test_mode: Whether to run in test mode (no actual API calls)
+
+    Returns:
+        List of request coroutines to dispatch (empty in test mode)
     """
+    requests_to_send: List[Any] = []
+
+    for item in existing_lists:
+        if not new_entries:
+            return requests_to_send
+
+        space_left = 50 - len(item["_entity_texts"])
+        if space_left <= 0:
+            continue
+
+        to_add = list(itertools.islice(new_entries, space_left))
+
+        item["_entity_texts"].update(to_add)
+        payload = {
+            "id": item["id"],
+            "label": item["label"],
+            "entities": [_keyword_entity(text) for text in item["_entity_texts"]],
+            "type": "customTopic",
+        }
+
+        if test_mode:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Test mode: Prepared PUT request payload: %s",
+                    orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode(),
+                )
+        else:
+            requests_to_send.append(
+                _update_feedly_list(
+                    session,
+                    limiter,
+                    upload_url,
+                    payload,
+                    headers,
+                    item["label"],
+                    logger,
+                )
+            )
+
+        new_entries.difference_update(to_add)
+
     while new_entries:
-        added = False
-        for item in existing_lists:
-            if len(item["entities"]) < 50:
-                current_entities = {
-                    entity.get("text") for entity in item.get("entities", [])
-                }
-
-                to_add = list(new_entries - current_entities)
-                if to_add:
-                    space_left = 50 - len(item["entities"])
-                    to_add = to_add[:space_left]
-
-                    item["entities"].extend(
-                        {"type": "customKeyword", "text": name} for name in to_add
-                    )
-                    payload = {
-                        "id": item["id"],
-                        "label": item["label"],
-                        "entities": item["entities"],
-                        "type": "customTopic",
-                    }
-
-                    if test_mode:
-                        logger.info(
-                            "Test mode: Prepared PUT request payload: %s",
-                            json.dumps(payload, indent=2),
-                        )
-                    else:
-                        _update_feedly_list(
-                            upload_url, payload, headers, item["label"], logger
-                        )
-                        time.sleep(1)
-
-                    new_entries -= set(to_add)
-                    added = True
-                    break
-
-        if not added and new_entries:
-            _create_new_feedly_list(
-                new_entries,
-                object_type,
-                list_counts,
-                upload_url,
-                headers,
-                logger,
-                test_mode,
+        to_add = list(itertools.islice(new_entries, 50))
+        new_entries.difference_update(to_add)
+
+        list_counts[object_type] += 1
+        new_label = f"{object_type}-{list_counts[object_type]}"
+        logger.debug("Creating new list '%s' for remaining entries", new_label)
+
+        payload = {
+            "label": new_label,
+            "entities": [_keyword_entity(name) for name in to_add],
+            "type": "customTopic",
+        }
+
+        if test_mode:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Test mode: Prepared POST request payload: %s",
+                    orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode(),
+                )
+        else:
+            requests_to_send.append(
+                _create_new_feedly_list(
+                    session, limiter, upload_url, payload, headers, new_label, logger
+                )
             )
 
+    return requests_to_send
+
 
-def _update_feedly_list(
+async def _update_feedly_list(
+    session: RetryClient,
+    limiter: AsyncLimiter,
     upload_url: str,
     payload: Dict[str, Any],
     headers: Dict[str, str],
@@ -307,6 +441,8 @@ def _update_feedly_list(
     """Update an existing Feedly list.
 
     Args:
+        session: Shared HTTP session for Feedly requests
+        limiter: Rate limiter shared by all Feedly requests
         upload_url: URL for Feedly API
         payload: Request payload
         headers: HTTP headers for the request
@@ -314,112 +450,135 @@ def _update_feedly_list(
         logger: Logger instance
     """
     try:
-        response = requests.put(upload_url, json=payload, headers=headers, timeout=30)
-        if response.status_code == 204:
-            logger.info("Added new entities to '%s'", label)
-        else:
-            logger.error(
-                "Failed to add entities to '%s': %d - %s",
-                label,
-                response.status_code,
-                response.text,
-            )
-    except requests.RequestException as e:
+        async with limiter:
+            async with session.put(
+                upload_url,
+                data=orjson.dumps(payload),
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                if response.status == 204:
+                    logger.info("Added new entities to '%s'", label)
+                else:
+                    logger.error(
+                        "Failed to add entities to '%s': %d - %s",
+                        label,
+                        response.status,
+                        await response.text(),
+                    )
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         logger.error("Request error updating list '%s': %s", label, str(e))
 
 
-def _create_new_feedly_list(
-    new_entries: Set[str],
-    object_type: str,
-    list_counts: Dict[str, int],
+async def _create_new_feedly_list(
+    session: RetryClient,
+    limiter: AsyncLimiter,
     upload_url: str,
+    payload: Dict[str, Any],
     headers: Dict[str, str],
+    label: str,
     logger: logging.Logger,
-    test_mode: bool,
 ) -> None:
     """Create a new Feedly list.
 
     Args:
-        new_entries: Set of entries to add to the new list
-        object_type: Type of object being processed
-        list_counts: Counts of existing lists by object type
+        session: Shared HTTP session for Feedly requests
+        limiter: Rate limiter shared by all Feedly requests
         upload_url: URL for Feedly API
+        payload: Request payload
         headers: HTTP headers for the request
+        label: Label of the list being created
+        logger: Logger instance
+    """
+    try:
+        async with limiter:
+            async with session.post(
+                upload_url,
+                data=orjson.dumps(payload),
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                if response.status == 204:
+                    logger.info("Created new list '%s' and added entities", label)
+                else:
+                    logger.error(
+                        "Failed to create list '%s' and add entities: %d - %s",
+                        label,
+                        response.status,
+                        await response.text(),
+                    )
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error("Request error creating list '%s': %s", label, str(e))
+
+
+async def _run(config: Dict[str, Any], logger: logging.Logger) -> None:
+    """Run the full synchronization over a single pooled HTTP session.
+
+    Args:
+        config: Loaded configuration values
         logger: Logger instance
-        test_mode: Whether to run in test mode (no actual API calls)
     """
-    list_counts[object_type] += 1
-    new_label = f"{object_type}-{list_counts[object_type]}"
-    logger.debug("Creating new list '%s' for remaining entries", new_label)
-
-    to_add = list(new_entries)[:50]
-    payload = {
-        "label": new_label,
-        "entities": [{"type": "customKeyword", "text": name} for name in to_add],
-        "type": "customTopic",
+    jira_url = config["jira_url"]
+    aql_query = config["aql_query"]
+    page_size = config["page_size"]
+    upload_url = config["upload_url"]
+    jira_api_token = config["jira_api_token"]
+    api_key = config["api_key"]
+
+    jira_headers = {
+        "Authorization": f"Bearer {jira_api_token}",
+        "Content-Type": "application/json",
     }
 
-    if test_mode:
-        logger.info(
-            "Test mode: Prepared POST request payload: %s",
-            json.dumps(payload, indent=2),
+    feedly_headers = {
+        "accept": "application/json",
+        "content-type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+    }
+
+    connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+
+    # Retry transient failures (429 and 5xx) with exponential backoff
+    # instead of dropping page ranges or updates and forcing a full
+    # re-run of the sync.
+    retry_options = ExponentialRetry(
+        attempts=5,
+        start_timeout=0.5,
+        statuses={429, 500, 502, 503, 504},
+    )
+
+    async with RetryClient(
+        connector=connector, retry_options=retry_options
+    ) as session:
+        jira_entries = await fetch_jira_data(
+            session, jira_url, aql_query, page_size, jira_headers, logger
+        )
+        jira_data = process_entries(jira_entries, logger)
+        feedly_data = await fetch_feedly_data(
+            session, upload_url, feedly_headers, logger
         )
-    else:
-        try:
-            response = requests.post(
-                upload_url, json=payload, headers=headers, timeout=30
-            )
-            if response.status_code == 204:
-                logger.info("Created new list '%s' and added entities", new_label)
-            else:
-                logger.error(
-                    "Failed to create list '%s' and add entities: %d - %s",
-                    new_label,
-                    response.status_code,
-                    response.text,
-                )
-        except requests.RequestException as e:
-            logger.error("Request error creating list '%s': %s", new_label, str(e))
-        time.sleep(1)
 
-    new_entries -= set(to_add)
+        await sync_to_feedly(
+            session,
+            jira_data,
+            feedly_data,
+            upload_url,
+            feedly_headers,
+            logger,
+            test_mode=False,
+        )
 
 
 def main():
     """Main function to run the Feedly Asset Integrator."""
+    listener = None
     try:
         config = load_config("config.json")
 
-        jira_url = config["jira_url"]
-        aql_query = config["aql_query"]
-        page_size = config["page_size"]
-        upload_url = config["upload_url"]
-        jira_api_token = config["jira_api_token"]
-        api_key = config["api_key"]
-
         log_filename = "feedly_asset_sync.log"
-        logger = setup_logger(log_filename)
-
-        jira_headers = {
-            "Authorization": f"Bearer {jira_api_token}",
-            "Content-Type": "application/json",
-        }
+        logger, listener = setup_logger(log_filename)
 
-        feedly_headers = {
-            "accept": "application/json",
-            "content-type": "application/json",
-            "Authorization": f"Bearer {api_key}",
-        }
-
-        jira_entries = fetch_jira_data(
-            jira_url, aql_query, page_size, jira_headers, logger
-        )
-        jira_data = process_entries(jira_entries, logger)
-        feedly_data = fetch_feedly_data(upload_url, feedly_headers, logger)
-
-        sync_to_feedly(
-            jira_data, feedly_data, upload_url, feedly_headers, logger, test_mode=False
-        )
+        asyncio.run(_run(config, logger))
     except FileNotFoundError as e:
         logger = logging.getLogger("FeedlyAssetIntegrator")
         logger.error("File not found: %s", str(e))
@@ -429,6 +588,9 @@ def main():
     except KeyError as e:
         logger = logging.getLogger("FeedlyAssetIntegrator")
         logger.error("Missing required configuration key: %s", str(e))
+    finally:
+        if listener is not None:
+            listener.stop()
 
 
 if __name__ == "__main__":